@@ -5,7 +5,7 @@
  * Provides a clean abstraction over Playwright's browser APIs.
  */
 
-import { Browser, BrowserContext, chromium } from "playwright";
+import type { Browser, BrowserContext } from "playwright";
 import type { BrowserOptions } from "../types/browser.js";
 
 /**
@@ -53,6 +53,8 @@ export class BrowserManager {
     if (this.browser) return this.browser;
 
     try {
+      // Loaded on demand so importing the package does not pull in Playwright
+      const { chromium } = await import("playwright");
       this.browser = await chromium.launch({
         headless: options.headless ?? true,
         timeout: options.timeout ?? 30000,
@@ -5,7 +5,7 @@
  * Provides connection management, health checks, and proper cleanup.
  */
 
-import { request, type APIRequestContext } from "playwright";
+import type { APIRequestContext } from "playwright";
 
 /**
  * Manages HTTP requests to the browser automation service.
@@ -35,6 +35,8 @@ export class RequestManager {
    */
   async initialize(): Promise<void> {
     try {
+      // Loaded on demand so importing the package does not pull in Playwright
+      const { request } = await import("playwright");
       this.requestContext = await request.newContext({
         baseURL: this.baseUrl,
         timeout: 30000,
@@ -6,7 +6,7 @@
  * the complex logic of running tests with proper error handling and logging.
  */
 
-import { BrowserContext, Page, ConsoleMessage, Request, Response } from "playwright";
+import type { BrowserContext, Page, ConsoleMessage, Request, Response } from "playwright";
 import type { TestResult, TestCase, TestConfig } from "../types/index.js";
 
 /**
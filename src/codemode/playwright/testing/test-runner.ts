@@ -6,7 +6,7 @@
  * detailed reporting, and proper resource management with cleanup.
  */
 
-import { Browser, BrowserContext, chromium } from "playwright";
+import type { Browser, BrowserContext } from "playwright";
 import type { TestSuite, TestConfig, TestResult } from "../types/index.js";
 import { executeTest } from "./test-executor.js";
 
@@ -67,6 +67,8 @@ export class TestRunner {
    */
   async initialize(config: TestConfig = {}): Promise<void> {
     try {
+      // Loaded on demand so importing the package does not pull in Playwright
+      const { chromium } = await import("playwright");
       this.browser = await chromium.launch({
         headless: config.headless ?? true,
         timeout: config.timeout ?? 30000,
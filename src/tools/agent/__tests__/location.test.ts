@@ -0,0 +1,64 @@
+/**
+ * @file Location Tools Tests
+ *
+ * Tests for retry behaviour of idempotent location and weather requests
+ */
+
+import { describe, it, expect, vi, afterEach } from "vitest";
+import { LocationTools } from "../location";
+
+const fetchWithRetry = (url: string, init?: RequestInit): Promise<Response> =>
+  LocationTools["fetchWithRetry"](url, init);
+
+describe("LocationTools.fetchWithRetry", () => {
+  afterEach(() => {
+    vi.unstubAllGlobals();
+  });
+
+  it("should return the successful response after a 503", async () => {
+    const fetchMock = vi
+      .fn()
+      .mockResolvedValueOnce(new Response(null, { status: 503 }))
+      .mockResolvedValueOnce(new Response("ok", { status: 200 }));
+    vi.stubGlobal("fetch", fetchMock);
+
+    const response = await fetchWithRetry("https://example.test/");
+
+    expect(response.status).toBe(200);
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+
+  it("should return the last 503 after three attempts", async () => {
+    const fetchMock = vi.fn().mockImplementation(async () => new Response(null, { status: 503 }));
+    vi.stubGlobal("fetch", fetchMock);
+
+    const response = await fetchWithRetry("https://example.test/");
+
+    expect(response.status).toBe(503);
+    expect(fetchMock).toHaveBeenCalledTimes(3);
+  });
+
+  it("should retry a rejected fetch", async () => {
+    const fetchMock = vi
+      .fn()
+      .mockRejectedValueOnce(new TypeError("fetch failed"))
+      .mockResolvedValueOnce(new Response("ok", { status: 200 }));
+    vi.stubGlobal("fetch", fetchMock);
+
+    const response = await fetchWithRetry("https://example.test/");
+
+    expect(response.status).toBe(200);
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+
+  it("should rethrow an abort without retrying", async () => {
+    const controller = new AbortController();
+    controller.abort();
+    const abortError = new DOMException("This operation was aborted", "AbortError");
+    const fetchMock = vi.fn().mockRejectedValue(abortError);
+    vi.stubGlobal("fetch", fetchMock);
+
+    await expect(fetchWithRetry("https://example.test/", { signal: controller.signal })).rejects.toBe(abortError);
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+  });
+});
@@ -6,6 +6,11 @@
 
 import { ToolResult } from "../types";
 
+/** Gateway errors worth retrying for idempotent GET requests */
+const RETRYABLE_STATUSES = new Set([502, 503, 504]);
+const MAX_ATTEMPTS = 3;
+const RETRY_BASE_DELAY_MS = 50;
+
 /**
  * Get current location information
  */
@@ -67,7 +72,7 @@ export class LocationTools {
         const controller = new AbortController();
         const timeoutId = setTimeout(() => controller.abort(), 5000); // 5 second timeout
 
-        const response = await fetch(api.url, {
+        const response = await LocationTools.fetchWithRetry(api.url, {
           signal: controller.signal,
           headers: {
             "User-Agent": "Reynard-Agent-Tools/1.0",
@@ -128,6 +133,30 @@ export class LocationTools {
     };
   }
 
+  /**
+   * Fetch an idempotent GET resource, retrying gateway errors and dropped connections
+   *
+   * Retries back off exponentially and reuse fetch's keep-alive pool. Aborts
+   * from the caller's signal are never retried.
+   */
+  private static async fetchWithRetry(url: string, init: RequestInit = {}): Promise<Response> {
+    for (let attempt = 1; ; attempt++) {
+      try {
+        const response = await fetch(url, init);
+        if (!RETRYABLE_STATUSES.has(response.status) || attempt >= MAX_ATTEMPTS) {
+          return response;
+        }
+        // Release the connection back to the pool before retrying
+        await response.body?.cancel();
+      } catch (error) {
+        if (init.signal?.aborted || attempt >= MAX_ATTEMPTS) {
+          throw error;
+        }
+      }
+      await new Promise(resolve => setTimeout(resolve, RETRY_BASE_DELAY_MS * 2 ** (attempt - 1)));
+    }
+  }
+
   private static getCountryName(countryCode: string): string {
     const countryMap: Record<string, string> = {
       US: "United States",
@@ -182,7 +211,7 @@ export class LocationTools {
         };
       }
 
-      const weatherResponse = await fetch(
+      const weatherResponse = await LocationTools.fetchWithRetry(
         `https://api.openweathermap.org/data/2.5/weather?lat=${latitude}&lon=${longitude}&appid=${apiKey}&units=metric`
       );
 
@@ -5,6 +5,7 @@
  */
 
 import { describe, it, expect, beforeEach, afterEach } from "vitest";
+import { join } from "path";
 import { ChangeAnalysis } from "../changes";
 import {
   createTempGitRepo,
@@ -418,5 +419,54 @@ describe("ChangeAnalysis", () => {
       }
     });
   });
-});
 
+  describe("iterateChanges", () => {
+    it("should yield staged changes in pages", async () => {
+      await createFile(repo.path, "a.ts", "export const a = 1;");
+      await createFile(repo.path, "b.ts", "export const b = 1;");
+      await createFile(repo.path, "c.ts", "export const c = 1;");
+      stageFile(repo.path, "a.ts");
+      stageFile(repo.path, "b.ts");
+      stageFile(repo.path, "c.ts");
+
+      const pages = [];
+      for await (const page of ChangeAnalysis.iterateChanges({ cwd: repo.path, staged: true, pageSize: 2 })) {
+        pages.push(page);
+      }
+
+      expect(pages.map(page => page.length)).toEqual([2, 1]);
+      expect(pages.flat().map(change => change.path)).toEqual(["a.ts", "b.ts", "c.ts"]);
+      expect(pages[0]?.[0]?.linesAdded).toBe(1);
+    });
+
+    it("should yield nothing when there are no changes", async () => {
+      const pages = [];
+      for await (const page of ChangeAnalysis.iterateChanges({ cwd: repo.path })) {
+        pages.push(page);
+      }
+
+      expect(pages).toHaveLength(0);
+    });
+
+    it("should throw for non-git directory", async () => {
+      const iterate = async () => {
+        for await (const _page of ChangeAnalysis.iterateChanges({ cwd: "/tmp/not-a-git-repo" })) {
+          // drain
+        }
+      };
+
+      await expect(iterate()).rejects.toThrow();
+    });
+
+    it("should throw instead of diffing the parent repository from a subdirectory", async () => {
+      await createFile(repo.path, "nested/a.ts", "export const a = 1;");
+      const iterate = async () => {
+        for await (const _page of ChangeAnalysis.iterateChanges({ cwd: join(repo.path, "nested") })) {
+          // drain
+        }
+      };
+
+      await expect(iterate()).rejects.toThrow("not a git repository");
+    });
+  });
+});
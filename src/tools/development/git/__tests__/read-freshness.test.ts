@@ -0,0 +1,88 @@
+/**
+ * @file Git Read Freshness Tests
+ *
+ * Tests that read tools observe repository writes made outside the git tools
+ */
+
+import { describe, it, expect, beforeEach, afterEach } from "vitest";
+import { execSync } from "child_process";
+import { StatusOperations } from "../status";
+import { RemoteInfo } from "../remote-info";
+import { invalidateGitCache } from "../runner";
+import { createTempGitRepo, createFile, stageFile, commit, modifyFile, type TempGitRepo } from "./test-utils";
+
+describe("git read tools after external writes", () => {
+  let repo: TempGitRepo;
+
+  beforeEach(async () => {
+    repo = await createTempGitRepo();
+    invalidateGitCache();
+    await createFile(repo.path, "index.ts", "export const a = 1;");
+    stageFile(repo.path, "index.ts");
+    commit(repo.path);
+  });
+
+  afterEach(async () => {
+    await repo.cleanup();
+  });
+
+  it("gitStatus should see a file edit", async () => {
+    expect((await StatusOperations.gitStatus({ cwd: repo.path })).data.isClean).toBe(true);
+    await modifyFile(repo.path, "index.ts", "export const a = 2;");
+
+    expect((await StatusOperations.gitStatus({ cwd: repo.path })).data.isClean).toBe(false);
+  });
+
+  it("getCurrentBranch should see a checkout", async () => {
+    await StatusOperations.getCurrentBranch({ cwd: repo.path });
+    execSync("git checkout -b feature", { cwd: repo.path, stdio: "pipe" });
+
+    expect((await StatusOperations.getCurrentBranch({ cwd: repo.path })).data.branch).toBe("feature");
+  });
+
+  it("getLatestCommit should see a new commit", async () => {
+    const before = (await StatusOperations.getLatestCommit({ cwd: repo.path })).data.hash;
+    await modifyFile(repo.path, "index.ts", "export const a = 2;");
+    stageFile(repo.path, "index.ts");
+    commit(repo.path, "Second commit");
+
+    const after = (await StatusOperations.getLatestCommit({ cwd: repo.path })).data.hash;
+    expect(after).not.toBe(before);
+    expect(after).toBe(execSync("git rev-parse HEAD", { cwd: repo.path, encoding: "utf-8" }).trim());
+  });
+
+  it("getRepositorySnapshot should see a file edit", async () => {
+    expect((await StatusOperations.getRepositorySnapshot({ cwd: repo.path })).data.isClean).toBe(true);
+    await modifyFile(repo.path, "index.ts", "export const a = 2;");
+
+    const snapshot = (await StatusOperations.getRepositorySnapshot({ cwd: repo.path })).data;
+    expect(snapshot.isClean).toBe(false);
+    expect(snapshot.unstaged).toBe(1);
+  });
+
+  it("remote queries should see a remote added and changed with git directly", async () => {
+    expect((await RemoteInfo.checkRemoteExists({ remoteName: "origin", cwd: repo.path })).data.exists).toBe(false);
+    await RemoteInfo.listRemotes({ cwd: repo.path });
+    execSync("git remote add origin https://example.com/a.git", { cwd: repo.path, stdio: "pipe" });
+
+    expect((await RemoteInfo.checkRemoteExists({ remoteName: "origin", cwd: repo.path })).data.exists).toBe(true);
+    expect((await RemoteInfo.listRemotes({ cwd: repo.path })).data.remotes).toHaveLength(1);
+
+    await RemoteInfo.getRemoteUrl({ remoteName: "origin", cwd: repo.path });
+    execSync("git remote set-url origin https://example.com/b.git", { cwd: repo.path, stdio: "pipe" });
+
+    expect((await RemoteInfo.getRemoteUrl({ remoteName: "origin", cwd: repo.path })).data.url).toBe(
+      "https://example.com/b.git"
+    );
+  });
+
+  it("should serve cached output only when a TTL is requested", async () => {
+    const original = (await StatusOperations.getCurrentBranch({ cwd: repo.path, cacheTtlMs: 60_000 })).data.branch;
+    execSync("git checkout -b feature", { cwd: repo.path, stdio: "pipe" });
+
+    expect((await StatusOperations.getCurrentBranch({ cwd: repo.path, cacheTtlMs: 60_000 })).data.branch).toBe(
+      original
+    );
+    expect((await StatusOperations.getCurrentBranch({ cwd: repo.path })).data.branch).toBe("feature");
+  });
+});
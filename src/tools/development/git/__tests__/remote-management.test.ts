@@ -0,0 +1,55 @@
+/**
+ * @file Git Remote Management Tests
+ *
+ * Tests for pushing to a local bare remote
+ */
+
+import { describe, it, expect, beforeEach, afterEach } from "vitest";
+import { execSync } from "child_process";
+import { mkdtemp, rm } from "fs/promises";
+import { join } from "path";
+import { tmpdir } from "os";
+import { RemoteManagement } from "../remote-management";
+import { createTempGitRepo, createFile, stageFile, commit, type TempGitRepo } from "./test-utils";
+
+describe("RemoteManagement.push", () => {
+  let repo: TempGitRepo;
+  let remotePath: string;
+
+  beforeEach(async () => {
+    repo = await createTempGitRepo();
+    remotePath = await mkdtemp(join(tmpdir(), "git-remote-"));
+    execSync("git init --bare", { cwd: remotePath, stdio: "pipe" });
+    execSync(`git remote add origin "${remotePath}"`, { cwd: repo.path, stdio: "pipe" });
+
+    await createFile(repo.path, "index.ts", "export const a = 1;");
+    stageFile(repo.path, "index.ts");
+    commit(repo.path);
+    execSync("git tag v1.0.0", { cwd: repo.path, stdio: "pipe" });
+  });
+
+  afterEach(async () => {
+    await repo.cleanup();
+    await rm(remotePath, { recursive: true, force: true });
+  });
+
+  it("should push the current branch and tags in one call", async () => {
+    const branch = execSync("git branch --show-current", { cwd: repo.path, encoding: "utf-8" }).trim();
+    const head = execSync("git rev-parse HEAD", { cwd: repo.path, encoding: "utf-8" }).trim();
+
+    const result = await RemoteManagement.push({ remoteName: "origin", tags: true, cwd: repo.path });
+
+    expect(result.success).toBe(true);
+    const remoteRefs = execSync("git show-ref", { cwd: remotePath, encoding: "utf-8" });
+    expect(remoteRefs).toContain(`${head} refs/heads/${branch}`);
+    expect(remoteRefs).toContain("refs/tags/v1.0.0");
+  });
+
+  it("should leave tags behind when tags is not set", async () => {
+    const result = await RemoteManagement.push({ remoteName: "origin", cwd: repo.path });
+
+    expect(result.success).toBe(true);
+    const remoteRefs = execSync("git show-ref", { cwd: remotePath, encoding: "utf-8" });
+    expect(remoteRefs).not.toContain("refs/tags/v1.0.0");
+  });
+});
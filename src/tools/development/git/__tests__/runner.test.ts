@@ -0,0 +1,107 @@
+/**
+ * @file Git Runner Tests
+ *
+ * Tests for the shared git command runner and its read cache
+ */
+
+import { describe, it, expect, beforeEach, afterEach } from "vitest";
+import {
+  runGit,
+  runGitAsync,
+  runGitCached,
+  invalidateGitCache,
+  getGitCacheSize,
+  GitCommandError,
+} from "../runner";
+import { createTempGitRepo, createFile, type TempGitRepo } from "./test-utils";
+
+describe("runGit", () => {
+  it("should throw GitCommandError with exit code and stderr on failure", async () => {
+    const repo = await createTempGitRepo();
+    try {
+      let caught: unknown;
+      try {
+        runGit(["rev-parse", "--verify", "HEAD"], repo.path);
+      } catch (error) {
+        caught = error;
+      }
+
+      expect(caught).toBeInstanceOf(GitCommandError);
+      expect((caught as GitCommandError).exitCode).toBe(128);
+      expect((caught as GitCommandError).stderr).not.toBe("");
+      expect((caught as GitCommandError).args).toEqual(["rev-parse", "--verify", "HEAD"]);
+    } finally {
+      await repo.cleanup();
+    }
+  });
+});
+
+describe("runGitAsync", () => {
+  it("should resolve with stdout", async () => {
+    const repo = await createTempGitRepo();
+    try {
+      await createFile(repo.path, "new.ts", "export {};");
+      await expect(runGitAsync(["status", "--short"], repo.path)).resolves.toContain("new.ts");
+    } finally {
+      await repo.cleanup();
+    }
+  });
+
+  it("should reject with GitCommandError carrying the exit code", async () => {
+    const repo = await createTempGitRepo();
+    try {
+      await expect(runGitAsync(["rev-parse", "--verify", "HEAD"], repo.path)).rejects.toMatchObject({
+        name: "GitCommandError",
+        exitCode: 128,
+      });
+    } finally {
+      await repo.cleanup();
+    }
+  });
+});
+
+describe("runGitCached", () => {
+  let repo: TempGitRepo;
+
+  beforeEach(async () => {
+    repo = await createTempGitRepo();
+    invalidateGitCache();
+  });
+
+  afterEach(async () => {
+    await repo.cleanup();
+  });
+
+  it("should reuse output within the TTL", async () => {
+    const before = runGitCached(["status", "--short"], repo.path, 60_000);
+    await createFile(repo.path, "new.ts", "export {};");
+
+    expect(runGitCached(["status", "--short"], repo.path, 60_000)).toBe(before);
+    expect(runGit(["status", "--short"], repo.path)).toContain("new.ts");
+  });
+
+  it("should refresh after invalidation", async () => {
+    runGitCached(["status", "--short"], repo.path, 60_000);
+    await createFile(repo.path, "new.ts", "export {};");
+    invalidateGitCache(repo.path);
+
+    expect(runGitCached(["status", "--short"], repo.path, 60_000)).toContain("new.ts");
+  });
+
+  it("should drop entries once their TTL has passed", async () => {
+    runGitCached(["status", "--short"], repo.path, 1);
+    expect(getGitCacheSize()).toBe(1);
+
+    await new Promise(resolve => setTimeout(resolve, 10));
+    runGitCached(["branch", "--show-current"], repo.path, 60_000);
+
+    expect(getGitCacheSize()).toBe(1);
+  });
+
+  it("should bypass the cache when TTL is 0", async () => {
+    runGitCached(["status", "--short"], repo.path, 0);
+    await createFile(repo.path, "new.ts", "export {};");
+
+    expect(runGitCached(["status", "--short"], repo.path, 0)).toContain("new.ts");
+  });
+});
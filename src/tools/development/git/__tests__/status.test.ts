@@ -0,0 +1,156 @@
+/**
+ * @file Git Status Tests
+ *
+ * Tests for porcelain v2 parsing and repository snapshots
+ */
+
+import { describe, it, expect, beforeEach, afterEach } from "vitest";
+import { StatusOperations } from "../status";
+import { parsePorcelainV2 } from "../status-porcelain-parser";
+import { createTempGitRepo, createFile, stageFile, commit, modifyFile, type TempGitRepo } from "./test-utils";
+
+describe("parsePorcelainV2", () => {
+  it("should parse branch headers", () => {
+    const snapshot = parsePorcelainV2(
+      [
+        "# branch.oid 1234567890abcdef",
+        "# branch.head main",
+        "# branch.upstream origin/main",
+        "# branch.ab +2 -1",
+        "",
+      ].join("\0")
+    );
+
+    expect(snapshot.commit).toBe("1234567890abcdef");
+    expect(snapshot.branch).toBe("main");
+    expect(snapshot.upstream).toBe("origin/main");
+    expect(snapshot.ahead).toBe(2);
+    expect(snapshot.behind).toBe(1);
+    expect(snapshot.isClean).toBe(true);
+  });
+
+  it("should report initial and detached states as null", () => {
+    const snapshot = parsePorcelainV2("# branch.oid (initial)\0# branch.head (detached)\0");
+
+    expect(snapshot.commit).toBeNull();
+    expect(snapshot.branch).toBeNull();
+  });
+
+  it("should count staged, unstaged, untracked and conflicted entries", () => {
+    const snapshot = parsePorcelainV2(
+      [
+        "# branch.head main",
+        "1 M. N... 100644 100644 100644 aaaa bbbb src/staged file.ts",
+        "1 .M N... 100644 100644 100644 aaaa aaaa src/unstaged.ts",
+        "2 R. N... 100644 100644 100644 aaaa aaaa R100 src/new.ts",
+        "src/old.ts",
+        "u UU N... 100644 100644 100644 100644 aaaa bbbb cccc src/conflict.ts",
+        "? notes.txt",
+        "",
+      ].join("\0")
+    );
+
+    expect(snapshot.entries).toHaveLength(5);
+    expect(snapshot.entries[0]?.path).toBe("src/staged file.ts");
+    expect(snapshot.entries[2]).toEqual({ path: "src/new.ts", index: "R", worktree: ".", origPath: "src/old.ts" });
+    expect(snapshot.entries[3]?.path).toBe("src/conflict.ts");
+    expect(snapshot.staged).toBe(2);
+    expect(snapshot.unstaged).toBe(1);
+    expect(snapshot.untracked).toBe(1);
+    expect(snapshot.conflicted).toBe(1);
+    expect(snapshot.isClean).toBe(false);
+  });
+
+  it("should keep non-ASCII and tab characters in paths verbatim", () => {
+    const snapshot = parsePorcelainV2(
+      [
+        "2 R. N... 100644 100644 100644 aaaa aaaa R100 d\te.txt",
+        "b c.txt",
+        "? café.txt",
+        "",
+      ].join("\0")
+    );
+
+    expect(snapshot.entries).toEqual([
+      { path: "d\te.txt", index: "R", worktree: ".", origPath: "b c.txt" },
+      { path: "café.txt", index: "?", worktree: "?" },
+    ]);
+  });
+});
+
+describe("StatusOperations.gitStatus", () => {
+  let repo: TempGitRepo;
+  const savedLocale = { LANG: process.env["LANG"], LANGUAGE: process.env["LANGUAGE"], LC_ALL: process.env["LC_ALL"] };
+
+  beforeEach(async () => {
+    repo = await createTempGitRepo();
+  });
+
+  afterEach(async () => {
+    for (const [key, value] of Object.entries(savedLocale)) {
+      if (value === undefined) {
+        delete process.env[key];
+      } else {
+        process.env[key] = value;
+      }
+    }
+    await repo.cleanup();
+  });
+
+  it("should detect a clean tree under a non-English locale", async () => {
+    await createFile(repo.path, "index.ts", "export const a = 1;");
+    stageFile(repo.path, "index.ts");
+    commit(repo.path);
+    process.env["LANG"] = "de_DE.UTF-8";
+    process.env["LANGUAGE"] = "de";
+    process.env["LC_ALL"] = "de_DE.UTF-8";
+
+    const result = await StatusOperations.gitStatus({ cwd: repo.path });
+
+    expect(result.success).toBe(true);
+    expect(result.data.isClean).toBe(true);
+  });
+});
+
+describe("StatusOperations.getRepositorySnapshot", () => {
+  let repo: TempGitRepo;
+
+  beforeEach(async () => {
+    repo = await createTempGitRepo();
+  });
+
+  afterEach(async () => {
+    await repo.cleanup();
+  });
+
+  it("should return branch, commit and changes from a real repository", async () => {
+    await createFile(repo.path, "index.ts", "export const a = 1;");
+    stageFile(repo.path, "index.ts");
+    commit(repo.path);
+    await modifyFile(repo.path, "index.ts", "export const a = 2;");
+
+    const result = await StatusOperations.getRepositorySnapshot({ cwd: repo.path });
+
+    expect(result.success).toBe(true);
+    expect(result.data.branch).toBeTruthy();
+    expect(result.data.commit).toMatch(/^[0-9a-f]{40}$/);
+    expect(result.data.unstaged).toBe(1);
+    expect(result.data.isClean).toBe(false);
+  });
+
+  it("should report non-ASCII paths without quoting", async () => {
+    await createFile(repo.path, "café.txt", "bonjour");
+
+    const result = await StatusOperations.getRepositorySnapshot({ cwd: repo.path });
+
+    expect(result.success).toBe(true);
+    expect(result.data.entries.map((entry: { path: string }) => entry.path)).toEqual(["café.txt"]);
+    expect(result.data.untracked).toBe(1);
+  });
+
+  it("should return error for non-git directory", async () => {
+    const result = await StatusOperations.getRepositorySnapshot({ cwd: "/tmp/not-a-git-repo" });
+
+    expect(result.success).toBe(false);
+  });
+});
@@ -4,7 +4,6 @@
  * Main parser for git diff output
  */
 
-import { execSync } from "child_process";
 import { FileChange } from "./types";
 import { parseStatusLine } from "./changes-status-parser";
 import { parseNumstat } from "./changes-numstat-parser";
@@ -12,76 +11,81 @@ import { parseNumstat } from "./changes-numstat-parser";
 /**
  * Parse file changes from git diff output
  * @param nameStatusOutput - Output from git diff --name-status
- * @param isStaged - Whether changes are staged
- * @param cwd - Working directory
+ * @param numstatOutput - Output from the matching git diff --numstat (empty if unavailable)
  * @param detectPackage - Function to detect package from file path
  * @returns Array of file changes
  */
 export function parseFileChanges(
   nameStatusOutput: string,
-  isStaged: boolean,
-  cwd: string,
+  numstatOutput: string,
   detectPackage: (path: string) => string | undefined
 ): FileChange[] {
   const changes: FileChange[] = [];
-  const nameStatusLines = nameStatusOutput.trim().split("\n").filter(Boolean);
-
-  if (nameStatusLines.length === 0) {
+  if (!nameStatusOutput.trim()) {
     return changes;
   }
 
   // Parse numstat for line counts
-  const numstatCommand = isStaged
-    ? "git diff --cached --numstat --find-renames=50"
-    : "git diff --numstat --find-renames=50";
-  let numstatOutput = "";
-  try {
-    numstatOutput = execSync(numstatCommand, { cwd, encoding: "utf-8", stdio: "pipe" });
-  } catch (error) {
-    // If numstat fails, continue without line counts
-  }
+  const lineCounts = parseNumstat(numstatOutput.split("\n"));
 
-  const numstatLines = numstatOutput.trim().split("\n").filter(Boolean);
-  const lineCounts = parseNumstat(numstatLines);
+  // Split once; empty lines are rejected by toFileChange
+  for (const line of nameStatusOutput.split("\n")) {
+    const change = toFileChange(line, lineCounts, detectPackage);
+    if (change) {
+      changes.push(change);
+    }
+  }
 
-  for (const line of nameStatusLines) {
-    const parsed = parseStatusLine(line);
-    if (!parsed) continue;
+  return changes;
+}
 
-    const { status, newPath, oldPath } = parsed;
+/**
+ * Build a file change from a single name-status line
+ * @param line - Line from git diff --name-status
+ * @param lineCounts - Line counts keyed by path, from parseNumstat
+ * @param detectPackage - Function to detect package from file path
+ * @returns File change, or null if the line cannot be parsed
+ */
+export function toFileChange(
+  line: string,
+  lineCounts: Map<string, { added: number; deleted: number }>,
+  detectPackage: (path: string) => string | undefined
+): FileChange | null {
+  const parsed = parseStatusLine(line);
+  if (!parsed) return null;
 
-    // For renamed files, use the new path
-    const filePath = newPath;
+  const { status, newPath, oldPath } = parsed;
 
-    // Get line counts - try new path first, then old path for renames
-    let counts = lineCounts.get(filePath);
-    if (!counts && oldPath) {
-      counts = lineCounts.get(oldPath);
-    }
-    if (!counts) {
-      counts = { added: 0, deleted: 0 };
-    }
+  // For renamed files, use the new path
+  const filePath = newPath;
 
-    // Extract file extension
-    const fileExt = filePath.includes(".") ? filePath.split(".").pop()?.toLowerCase() || "unknown" : "unknown";
+  // Get line counts - try new path first, then old path for renames
+  let counts = lineCounts.get(filePath);
+  if (!counts && oldPath) {
+    counts = lineCounts.get(oldPath);
+  }
+  if (!counts) {
+    counts = { added: 0, deleted: 0 };
+  }
 
-    // Detect package
-    const packageName = detectPackage(filePath);
+  // Extract file extension
+  const dotIndex = filePath.lastIndexOf(".");
+  const fileExt = dotIndex === -1 ? "unknown" : filePath.slice(dotIndex + 1).toLowerCase() || "unknown";
 
-    const change: FileChange = {
-      path: filePath,
-      status,
-      linesAdded: counts.added,
-      linesDeleted: counts.deleted,
-      fileType: fileExt,
-    };
+  // Detect package
+  const packageName = detectPackage(filePath);
 
-    if (packageName) {
-      change.package = packageName;
-    }
+  const change: FileChange = {
+    path: filePath,
+    status,
+    linesAdded: counts.added,
+    linesDeleted: counts.deleted,
+    fileType: fileExt,
+  };
 
-    changes.push(change);
+  if (packageName) {
+    change.package = packageName;
   }
 
-  return changes;
+  return change;
 }
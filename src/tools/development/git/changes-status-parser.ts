@@ -20,8 +20,10 @@ export interface ParsedStatus {
 export function parseStatusLine(line: string): ParsedStatus | null {
   if (line.length < 3) return null;
 
+  const kind = line[0];
+
   // Handle renamed files: R100 old/path new/path or R  old/path new/path
-  const renameMatch = line.match(/^R(\d+)?\s+(.+?)\s+(.+)$/);
+  const renameMatch = kind === "R" ? line.match(/^R(\d+)?\s+(.+?)\s+(.+)$/) : null;
   if (renameMatch && renameMatch[2] && renameMatch[3]) {
     const result: ParsedStatus = {
       status: "renamed",
@@ -35,7 +37,7 @@ export function parseStatusLine(line: string): ParsedStatus | null {
   }
 
   // Handle copied files: C100 old/path new/path or C  old/path new/path
-  const copyMatch = line.match(/^C(\d+)?\s+(.+?)\s+(.+)$/);
+  const copyMatch = kind === "C" ? line.match(/^C(\d+)?\s+(.+?)\s+(.+)$/) : null;
   if (copyMatch && copyMatch[2] && copyMatch[3]) {
     // Treat copies as additions (new file)
     const result: ParsedStatus = {
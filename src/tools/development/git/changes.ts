@@ -4,53 +4,67 @@
  * Analysis of git changes for commit message generation
  */
 
-import { execSync } from "child_process";
 import { ToolResult } from "../../types";
 import { FileChange } from "./types";
 import { validateGitRepository, detectPackage, categorizeFiles, calculateStats, determineSuggestedType } from "./changes-utils";
-import { parseFileChanges } from "./changes-parser";
+import { parseFileChanges, toFileChange } from "./changes-parser";
+import { addNumstatLine, type NumstatCounts } from "./changes-numstat-parser";
+import { runGitAsync, streamGitLines, GitCommandError } from "./runner";
+
+/**
+ * Build the git diff arguments shared by the name-status and numstat runs
+ * @param staged - Diff the index against HEAD instead of the working tree against the index
+ * @returns Diff arguments without the output format flag
+ */
+function diffArgsFor(staged: boolean): string[] {
+  return staged ? ["diff", "--cached", "--find-renames=50"] : ["diff", "--find-renames=50"];
+}
+
+/**
+ * Run the name-status and numstat diffs for one side of the index concurrently
+ * @param cwd - Working directory
+ * @param staged - Diff the index against HEAD instead of the working tree against the index
+ * @returns Array of file changes
+ */
+async function diffChanges(cwd: string, staged: boolean): Promise<FileChange[]> {
+  const diffArgs = diffArgsFor(staged);
+  const [nameStatus, numstat] = await Promise.all([
+    runGitAsync([...diffArgs, "--name-status"], cwd),
+    // If numstat fails, continue without line counts
+    runGitAsync([...diffArgs, "--numstat"], cwd).catch(() => ""),
+  ]);
+  return parseFileChanges(nameStatus, numstat, detectPackage);
+}
 
 /**
  * Get staged changes from git
  * @param cwd - Working directory
- * @returns Array of staged file changes
+ * @returns Promise resolving to staged file changes
  */
-function getStagedChanges(cwd: string): FileChange[] {
+async function getStagedChanges(cwd: string): Promise<FileChange[]> {
   try {
-    const stagedNameStatus = execSync("git diff --cached --name-status --find-renames=50", {
-      cwd,
-      encoding: "utf-8",
-      stdio: "pipe",
-    });
-    return parseFileChanges(stagedNameStatus, true, cwd, detectPackage);
+    return await diffChanges(cwd, true);
   } catch (error) {
-    const err = error as { status?: number; stderr?: string };
-    if (err.status !== 0 && !err.stderr?.includes("no staged changes")) {
-      throw new Error(`Failed to get staged changes: ${err instanceof Error ? err.message : String(err)}`);
+    if (error instanceof GitCommandError && error.stderr.includes("no staged changes")) {
+      return [];
     }
-    return [];
+    throw new Error(`Failed to get staged changes: ${error instanceof Error ? error.message : String(error)}`);
   }
 }
 
 /**
  * Get unstaged changes from git
  * @param cwd - Working directory
- * @returns Array of unstaged file changes
+ * @returns Promise resolving to unstaged file changes
  */
-function getUnstagedChanges(cwd: string): FileChange[] {
+async function getUnstagedChanges(cwd: string): Promise<FileChange[]> {
   try {
-    const unstagedNameStatus = execSync("git diff --name-status --find-renames=50", {
-      cwd,
-      encoding: "utf-8",
-      stdio: "pipe",
-    });
-    return parseFileChanges(unstagedNameStatus, false, cwd, detectPackage);
+    return await diffChanges(cwd, false);
   } catch (error) {
-    const err = error as { status?: number; stderr?: string };
-    if (err.status !== 0 && !err.stderr?.includes("no changes")) {
-      throw new Error(`Failed to get unstaged changes: ${err instanceof Error ? err.message : String(err)}`);
+    if (error instanceof GitCommandError && error.stderr.includes("no changes")) {
+      return [];
     }
-    return [];
+    throw new Error(`Failed to get unstaged changes: ${error instanceof Error ? error.message : String(error)}`);
   }
 }
 
@@ -141,8 +155,11 @@ export class ChangeAnalysis {
         };
       }
 
-      const stagedFiles = includeStaged ? getStagedChanges(cwd) : [];
-      const unstagedFiles = includeUnstaged ? getUnstagedChanges(cwd) : [];
+      // Staged and unstaged diffs are independent; run all four git commands at once
+      const [stagedFiles, unstagedFiles] = await Promise.all([
+        includeStaged ? getStagedChanges(cwd) : [],
+        includeUnstaged ? getUnstagedChanges(cwd) : [],
+      ]);
 
       return buildAnalysisResult(stagedFiles, unstagedFiles);
     } catch (error) {
@@ -152,4 +169,58 @@ export class ChangeAnalysis {
       };
     }
   }
+
+  /**
+   * Iterate over uncommitted changes in pages as git reports them
+   *
+   * Unlike analyzeUncommittedChanges, neither diff is held in memory as a
+   * single string. Line counts are streamed into a map first, since every
+   * page needs them, and the name-status diff is then streamed and yielded
+   * a page at a time. The two git commands therefore run one after the other.
+   *
+   * @param args - Configuration options
+   * @param args.cwd - Working directory (defaults to process.cwd())
+   * @param args.staged - Iterate staged instead of unstaged changes (defaults to false)
+   * @param args.pageSize - Maximum number of file changes per page (defaults to 1000)
+   * @returns Async generator yielding pages of file changes
+   * @throws Error if cwd is not the root of a git repository
+   * @example
+   * ```typescript
+   * for await (const page of ChangeAnalysis.iterateChanges({ staged: true, pageSize: 100 })) {
+   *   console.log(`${page.length} files`);
+   * }
+   * ```
+   */
+  static async *iterateChanges(args: {
+    cwd?: string;
+    staged?: boolean;
+    pageSize?: number;
+  }): AsyncGenerator<FileChange[]> {
+    const { cwd = process.cwd(), staged = false, pageSize = 1000 } = args;
+    if (!validateGitRepository(cwd)) {
+      throw new Error(`Directory is not a git repository: ${cwd}`);
+    }
+    const diffArgs = diffArgsFor(staged);
+
+    const lineCounts: NumstatCounts = new Map();
+    for await (const line of streamGitLines([...diffArgs, "--numstat"], cwd)) {
+      addNumstatLine(lineCounts, line);
+    }
+
+    let page: FileChange[] = [];
+    for await (const line of streamGitLines([...diffArgs, "--name-status"], cwd)) {
+      const change = toFileChange(line, lineCounts, detectPackage);
+      if (!change) continue;
+
+      page.push(change);
+      if (page.length >= pageSize) {
+        yield page;
+        page = [];
+      }
+    }
+
+    if (page.length > 0) {
+      yield page;
+    }
+  }
 }
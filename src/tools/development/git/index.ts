@@ -12,6 +12,8 @@ import { ChangeAnalysis } from "./changes";
 import { MessageGeneration } from "./message-generation";
 import { MessageAnalysis } from "./message-analysis";
 
+export { GitCommandError } from "./runner";
+
 /**
  * Git operations tools for development workflows
  *
@@ -23,6 +25,7 @@ export class GitTools {
   static gitStatus = StatusOperations.gitStatus;
   static getCurrentBranch = StatusOperations.getCurrentBranch;
   static getLatestCommit = StatusOperations.getLatestCommit;
+  static getRepositorySnapshot = StatusOperations.getRepositorySnapshot;
 
   // Remote operations
   static checkRemoteExists = RemoteInfo.checkRemoteExists;
@@ -36,6 +39,7 @@ export class GitTools {
 
   // Change analysis
   static analyzeUncommittedChanges = ChangeAnalysis.analyzeUncommittedChanges;
+  static iterateChanges = ChangeAnalysis.iterateChanges;
 
   // Commit operations
   static generateCommitMessage = MessageGeneration.generateCommitMessage;
@@ -4,8 +4,8 @@
  * Query and list git remote information
  */
 
-import { execSync } from "child_process";
 import { ToolResult } from "../../types";
+import { runGitCached } from "./runner";
 
 /**
  * Git remote information operations
@@ -23,10 +23,10 @@ export class RemoteInfo {
    * }
    * ```
    */
-  static async checkRemoteExists(args: { remoteName: string; cwd?: string }): Promise<ToolResult> {
+  static async checkRemoteExists(args: { remoteName: string; cwd?: string; cacheTtlMs?: number }): Promise<ToolResult> {
     try {
-      const { remoteName, cwd = process.cwd() } = args;
-      const remotes = execSync("git remote", { cwd, encoding: "utf-8" }).trim().split("\n").filter(Boolean);
+      const { remoteName, cwd = process.cwd(), cacheTtlMs = 0 } = args;
+      const remotes = runGitCached(["remote"], cwd, cacheTtlMs).trim().split("\n").filter(Boolean);
 
       const exists = remotes.includes(remoteName);
 
@@ -59,10 +59,10 @@ export class RemoteInfo {
    * }
    * ```
    */
-  static async getRemoteUrl(args: { remoteName: string; cwd?: string }): Promise<ToolResult> {
+  static async getRemoteUrl(args: { remoteName: string; cwd?: string; cacheTtlMs?: number }): Promise<ToolResult> {
     try {
-      const { remoteName, cwd = process.cwd() } = args;
-      const url = execSync(`git remote get-url ${remoteName}`, { cwd, encoding: "utf-8" }).trim();
+      const { remoteName, cwd = process.cwd(), cacheTtlMs = 0 } = args;
+      const url = runGitCached(["remote", "get-url", remoteName], cwd, cacheTtlMs).trim();
 
       return {
         success: true,
@@ -94,10 +94,10 @@ export class RemoteInfo {
    * }
    * ```
    */
-  static async listRemotes(args: { cwd?: string }): Promise<ToolResult> {
+  static async listRemotes(args: { cwd?: string; cacheTtlMs?: number }): Promise<ToolResult> {
     try {
-      const { cwd = process.cwd() } = args;
-      const remotesOutput = execSync("git remote -v", { cwd, encoding: "utf-8" });
+      const { cwd = process.cwd(), cacheTtlMs = 0 } = args;
+      const remotesOutput = runGitCached(["remote", "-v"], cwd, cacheTtlMs);
       const lines = remotesOutput.trim().split("\n").filter(Boolean);
 
       const remotes: Record<string, { fetch?: string; push?: string }> = {};
@@ -4,8 +4,9 @@
  * Add, update, and push to git remotes
  */
 
-import { execSync } from "child_process";
+import { execFileSync } from "child_process";
 import { ToolResult } from "../../types";
+import { runGit, invalidateGitCache } from "./runner";
 import { RemoteInfo } from "./remote-info";
 
 /**
@@ -38,7 +39,7 @@ export class RemoteManagement {
       const existsResult = await RemoteInfo.checkRemoteExists({ remoteName, cwd });
       if (existsResult.success && existsResult.data?.exists) {
         if (force) {
-          execSync(`git remote set-url ${remoteName} ${url}`, { cwd });
+          runGit(["remote", "set-url", remoteName, url], cwd);
         } else {
           return {
             success: false,
@@ -46,8 +47,9 @@ export class RemoteManagement {
           };
         }
       } else {
-        execSync(`git remote add ${remoteName} ${url}`, { cwd });
+        runGit(["remote", "add", remoteName, url], cwd);
       }
+      invalidateGitCache(cwd);
 
       return {
         success: true,
@@ -89,19 +91,21 @@ export class RemoteManagement {
     try {
       const { remoteName, branch, tags = false, mirror = false, cwd = process.cwd() } = args;
 
-      let command: string;
+      let pushArgs: string[];
       if (mirror) {
-        command = `git push --mirror ${remoteName}`;
-      } else if (tags) {
-        const currentBranch = branch || execSync("git branch --show-current", { cwd, encoding: "utf-8" }).trim();
-        execSync(`git push ${remoteName} ${currentBranch}`, { cwd, stdio: "inherit" });
-        command = `git push ${remoteName} --tags`;
+        pushArgs = ["push", "--mirror", remoteName];
       } else {
-        const currentBranch = branch || execSync("git branch --show-current", { cwd, encoding: "utf-8" }).trim();
-        command = `git push ${remoteName} ${currentBranch}`;
+        const currentBranch = branch || runGit(["branch", "--show-current"], cwd).trim();
+        // Branch and tags go over a single connection to the remote
+        pushArgs = tags ? ["push", remoteName, currentBranch, "--tags"] : ["push", remoteName, currentBranch];
       }
 
-      execSync(command, { cwd, stdio: "inherit" });
+      try {
+        execFileSync("git", pushArgs, { cwd, stdio: "inherit" });
+      } finally {
+        // Even a failed push may have updated some remote-tracking refs
+        invalidateGitCache(cwd);
+      }
 
       return {
         success: true,
@@ -4,8 +4,8 @@
  * Git repository verification and integrity operations
  */
 
-import { execSync } from "child_process";
 import { ToolResult } from "../../types";
+import { runGit } from "./runner";
 
 /**
  * Git repository operations
@@ -26,7 +26,7 @@ export class RepositoryOperations {
   static async verifyRepository(args: { cwd?: string }): Promise<ToolResult> {
     try {
       const { cwd = process.cwd() } = args;
-      const output = execSync("git fsck --full", { cwd, encoding: "utf-8" });
+      const output = runGit(["fsck", "--full"], cwd);
 
       const isHealthy = output.trim().length === 0 || output.includes("dangling");
 
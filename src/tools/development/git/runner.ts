@@ -0,0 +1,258 @@
+/**
+ * @file Git Command Runner
+ *
+ * Shared entry point for invoking the git binary from the git tools
+ */
+
+import { execFile, execFileSync, spawn } from "child_process";
+import { createInterface } from "readline";
+import { promisify } from "util";
+
+/**
+ * Output limit for buffered git commands
+ *
+ * child_process defaults to 1 MiB, which a diff over a large change set
+ * easily exceeds. streamGitLines() has no limit at all.
+ */
+const GIT_MAX_BUFFER_BYTES = 256 * 1024 * 1024;
+
+/**
+ * Variables applied on top of the caller's environment for every git invocation
+ *
+ * GIT_OPTIONAL_LOCKS=0 stops read-only commands such as `git status` from
+ * taking the index lock to refresh stat information, and LC_ALL=C keeps
+ * output in the untranslated form the parsers expect.
+ */
+const GIT_ENV_OVERRIDES = { GIT_OPTIONAL_LOCKS: "0", LC_ALL: "C" } as const;
+
+/**
+ * Build the environment for a git invocation from the live process environment
+ * @returns Current process.env merged with GIT_ENV_OVERRIDES
+ */
+function gitEnv(): NodeJS.ProcessEnv {
+  return { ...process.env, ...GIT_ENV_OVERRIDES };
+}
+
+/**
+ * Error raised when a git command cannot be started or exits unsuccessfully
+ */
+export class GitCommandError extends Error {
+  readonly args: string[];
+  readonly exitCode: number | null;
+  readonly stderr: string;
+
+  constructor(args: string[], exitCode: number | null, stderr: string, message?: string) {
+    super(message ?? `git ${args.join(" ")} failed${stderr ? `: ${stderr.trim()}` : ""}`);
+    this.name = "GitCommandError";
+    this.args = args;
+    this.exitCode = exitCode;
+    this.stderr = stderr;
+  }
+}
+
+/**
+ * Convert a child_process failure into a GitCommandError
+ * @param args - Arguments the command was run with
+ * @param error - Error thrown or emitted by child_process
+ * @returns Typed error carrying the exit code and stderr only
+ */
+function toGitCommandError(args: string[], error: unknown): GitCommandError {
+  const err = error as { status?: number | null; code?: unknown; stderr?: unknown; message?: string };
+  const stderr = typeof err.stderr === "string" ? err.stderr : "";
+  // execFileSync reports the exit code as `status`, async execFile as a numeric `code`
+  const exitCode = typeof err.status === "number" ? err.status : typeof err.code === "number" ? err.code : null;
+  return new GitCommandError(args, exitCode, stderr, stderr ? undefined : err.message);
+}
+
+/**
+ * Run a git command and return its stdout
+ *
+ * Spawns git directly with an argument vector instead of going through a
+ * shell, so each call costs a single process spawn and arguments never need
+ * quoting.
+ *
+ * @param args - Arguments passed to git (without the leading "git")
+ * @param cwd - Working directory
+ * @returns Command stdout decoded as UTF-8
+ * @throws GitCommandError if git cannot be started or exits with a non-zero status
+ * @example
+ * ```typescript
+ * const branch = runGit(["branch", "--show-current"], process.cwd()).trim();
+ * ```
+ */
+export function runGit(args: string[], cwd: string): string {
+  try {
+    return execFileSync("git", args, {
+      cwd,
+      env: gitEnv(),
+      encoding: "utf-8",
+      maxBuffer: GIT_MAX_BUFFER_BYTES,
+      stdio: "pipe",
+    });
+  } catch (error) {
+    throw toGitCommandError(args, error);
+  }
+}
+
+const execFileAsync = promisify(execFile);
+
+/**
+ * Run a git command without blocking the event loop
+ *
+ * Independent commands started with runGitAsync run concurrently, so
+ * awaiting them together costs roughly one command's latency.
+ *
+ * @param args - Arguments passed to git (without the leading "git")
+ * @param cwd - Working directory
+ * @returns Promise resolving to command stdout decoded as UTF-8
+ * @throws GitCommandError if git cannot be started or exits with a non-zero status
+ * @example
+ * ```typescript
+ * const [staged, unstaged] = await Promise.all([
+ *   runGitAsync(["diff", "--cached", "--name-status"], cwd),
+ *   runGitAsync(["diff", "--name-status"], cwd),
+ * ]);
+ * ```
+ */
+export async function runGitAsync(args: string[], cwd: string): Promise<string> {
+  try {
+    const { stdout } = await execFileAsync("git", args, {
+      cwd,
+      env: gitEnv(),
+      encoding: "utf-8",
+      maxBuffer: GIT_MAX_BUFFER_BYTES,
+    });
+    return stdout;
+  } catch (error) {
+    throw toGitCommandError(args, error);
+  }
+}
+
+const readCache = new Map<string, { expiresAt: number; output: string }>();
+
+/**
+ * Run a read-only git command, reusing output from a recent identical call
+ *
+ * Results are cached per working directory and argument list for `ttlMs`
+ * milliseconds. Operations that modify the repository should call
+ * invalidateGitCache() so subsequent reads observe the change. Writes made
+ * outside the git tools (commits, checkouts, file edits) cannot invalidate
+ * the cache, so callers opt in with a positive TTL only when a stale answer
+ * within that window is acceptable.
+ *
+ * @param args - Arguments passed to git (without the leading "git")
+ * @param cwd - Working directory
+ * @param ttlMs - How long the output stays valid; 0 disables caching
+ * @returns Command stdout decoded as UTF-8
+ * @example
+ * ```typescript
+ * const status = runGitCached(["status", "--short"], process.cwd(), 1000);
+ * ```
+ */
+export function runGitCached(args: string[], cwd: string, ttlMs: number): string {
+  if (ttlMs <= 0) {
+    return runGit(args, cwd);
+  }
+
+  const key = `${cwd}\0${args.join("\0")}`;
+  const now = performance.now();
+  const cached = readCache.get(key);
+  if (cached && cached.expiresAt > now) {
+    return cached.output;
+  }
+
+  const output = runGit(args, cwd);
+  sweepExpired(now);
+  readCache.set(key, { expiresAt: now + ttlMs, output });
+  return output;
+}
+
+/**
+ * Remove cache entries whose TTL has passed
+ * @param now - Current performance.now() timestamp
+ */
+function sweepExpired(now: number): void {
+  for (const [key, entry] of readCache) {
+    if (entry.expiresAt <= now) {
+      readCache.delete(key);
+    }
+  }
+}
+
+/**
+ * Number of entries currently held in the read cache
+ * @returns Cache size, including entries that expired since the last sweep
+ */
+export function getGitCacheSize(): number {
+  return readCache.size;
+}
+
+/**
+ * Drop cached read results
+ * @param cwd - Working directory to invalidate; omit to clear every entry
+ */
+export function invalidateGitCache(cwd?: string): void {
+  if (cwd === undefined) {
+    readCache.clear();
+    return;
+  }
+  const prefix = `${cwd}\0`;
+  for (const key of readCache.keys()) {
+    if (key.startsWith(prefix)) {
+      readCache.delete(key);
+    }
+  }
+}
+
+/**
+ * Stream the stdout of a git command line by line
+ *
+ * Lines are yielded as git produces them, so large outputs are never held in
+ * memory as a single string. Breaking out of the loop early terminates git.
+ *
+ * @param args - Arguments passed to git (without the leading "git")
+ * @param cwd - Working directory
+ * @returns Async generator of non-empty output lines
+ * @throws GitCommandError if git cannot be started or exits with a non-zero status
+ * @example
+ * ```typescript
+ * for await (const line of streamGitLines(["diff", "--numstat"], process.cwd())) {
+ *   console.log(line);
+ * }
+ * ```
+ */
+export async function* streamGitLines(args: string[], cwd: string): AsyncGenerator<string> {
+  const child = spawn("git", args, { cwd, env: gitEnv(), stdio: ["ignore", "pipe", "pipe"] });
+  let spawnError: Error | undefined;
+  let stderr = "";
+  child.on("error", error => {
+    spawnError = error;
+  });
+  child.stderr.setEncoding("utf-8");
+  child.stderr.on("data", chunk => {
+    stderr += chunk;
+  });
+  const closed = new Promise<number | null>(resolve => child.on("close", resolve));
+
+  let drained = false;
+  try {
+    const lines = createInterface({ input: child.stdout, crlfDelay: Infinity });
+    for await (const line of lines) {
+      if (line) yield line;
+    }
+    drained = true;
+  } finally {
+    // Consumer stopped early; git would otherwise block on a full pipe
+    if (!drained) {
+      child.kill();
+    }
+  }
+
+  const code = await closed;
+  if (spawnError) {
+    throw toGitCommandError(args, spawnError);
+  }
+  if (code !== 0) {
+    throw new GitCommandError(args, code, stderr);
+  }
+}
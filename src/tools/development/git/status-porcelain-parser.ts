@@ -0,0 +1,131 @@
+/**
+ * @file Git Porcelain v2 Status Parser
+ *
+ * Parses `git status --porcelain=v2 --branch -z` output into a repository snapshot
+ */
+
+export interface SnapshotEntry {
+  path: string;
+  index: string;
+  worktree: string;
+  origPath?: string;
+}
+
+export interface RepositorySnapshot {
+  branch: string | null;
+  commit: string | null;
+  upstream: string | null;
+  ahead: number;
+  behind: number;
+  entries: SnapshotEntry[];
+  staged: number;
+  unstaged: number;
+  untracked: number;
+  conflicted: number;
+  isClean: boolean;
+}
+
+/**
+ * Return the remainder of a line after skipping a number of space-separated fields
+ * @param line - Line to slice
+ * @param fields - Number of leading fields to skip
+ * @returns Remainder of the line, or an empty string if there are not enough fields
+ */
+function afterFields(line: string, fields: number): string {
+  let index = 0;
+  for (let i = 0; i < fields; i++) {
+    index = line.indexOf(" ", index);
+    if (index === -1) return "";
+    index++;
+  }
+  return line.slice(index);
+}
+
+/**
+ * Parse NUL-separated porcelain v2 status output with branch headers
+ *
+ * With `-z` git emits paths verbatim instead of C-quoting them, and the
+ * original path of a rename or copy follows as its own record.
+ *
+ * @param output - Output from `git status --porcelain=v2 --branch -z`
+ * @returns Repository snapshot with branch information and per-file entries
+ * @example
+ * parsePorcelainV2("# branch.oid abc123\0# branch.head main\0? notes.txt\0")
+ * // Returns { branch: "main", commit: "abc123", untracked: 1, ... }
+ */
+export function parsePorcelainV2(output: string): RepositorySnapshot {
+  const snapshot: RepositorySnapshot = {
+    branch: null,
+    commit: null,
+    upstream: null,
+    ahead: 0,
+    behind: 0,
+    entries: [],
+    staged: 0,
+    unstaged: 0,
+    untracked: 0,
+    conflicted: 0,
+    isClean: true,
+  };
+
+  const records = output.split("\0");
+  for (let i = 0; i < records.length; i++) {
+    const line = records[i];
+    if (!line) continue;
+
+    if (line.startsWith("# ")) {
+      const [key, ...rest] = line.slice(2).split(" ");
+      const value = rest.join(" ");
+      if (key === "branch.oid") {
+        snapshot.commit = value === "(initial)" ? null : value;
+      } else if (key === "branch.head") {
+        snapshot.branch = value === "(detached)" ? null : value;
+      } else if (key === "branch.upstream") {
+        snapshot.upstream = value;
+      } else if (key === "branch.ab") {
+        const match = value.match(/^\+(\d+) -(\d+)$/);
+        if (match && match[1] && match[2]) {
+          snapshot.ahead = parseInt(match[1], 10);
+          snapshot.behind = parseInt(match[2], 10);
+        }
+      }
+      continue;
+    }
+
+    const kind = line[0];
+    if (kind === "?") {
+      snapshot.entries.push({ path: line.slice(2), index: "?", worktree: "?" });
+      snapshot.untracked++;
+      continue;
+    }
+    if (kind !== "1" && kind !== "2" && kind !== "u") continue;
+
+    const index = line[2] ?? ".";
+    const worktree = line[3] ?? ".";
+    const entry: SnapshotEntry = { path: "", index, worktree };
+
+    if (kind === "1") {
+      entry.path = afterFields(line, 8);
+    } else if (kind === "2") {
+      entry.path = afterFields(line, 9);
+      // The original path is the next NUL-separated record
+      const origPath = records[++i];
+      if (origPath) {
+        entry.origPath = origPath;
+      }
+    } else {
+      entry.path = afterFields(line, 10);
+      snapshot.conflicted++;
+    }
+
+    if (kind !== "u") {
+      if (index !== ".") snapshot.staged++;
+      if (worktree !== ".") snapshot.unstaged++;
+    }
+
+    snapshot.entries.push(entry);
+  }
+
+  snapshot.isClean = snapshot.entries.length === 0;
+  return snapshot;
+}
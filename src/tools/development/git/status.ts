@@ -4,8 +4,9 @@
  * Git status, branch, and commit information operations
  */
 
-import { execSync } from "child_process";
 import { ToolResult } from "../../types";
+import { runGitCached } from "./runner";
+import { parsePorcelainV2 } from "./status-porcelain-parser";
 
 /**
  * Git status operations
@@ -16,6 +17,7 @@ export class StatusOperations {
    * @param args - Configuration options
    * @param args.cwd - Working directory path
    * @param args.short - Use short format output
+   * @param args.cacheTtlMs - Reuse output of an identical call for this many milliseconds (defaults to 0)
    * @returns Promise resolving to ToolResult with git status
    * @example
    * ```typescript
@@ -25,11 +27,10 @@ export class StatusOperations {
    * }
    * ```
    */
-  static async gitStatus(args: { cwd?: string; short?: boolean }): Promise<ToolResult> {
+  static async gitStatus(args: { cwd?: string; short?: boolean; cacheTtlMs?: number }): Promise<ToolResult> {
     try {
-      const { cwd = process.cwd(), short = false } = args;
-      const command = short ? "git status --short" : "git status";
-      const output = execSync(command, { cwd, encoding: "utf-8" });
+      const { cwd = process.cwd(), short = false, cacheTtlMs = 0 } = args;
+      const output = runGitCached(short ? ["status", "--short"] : ["status"], cwd, cacheTtlMs);
 
       return {
         success: true,
@@ -51,6 +52,7 @@ export class StatusOperations {
    * Get current git branch
    * @param args - Configuration options
    * @param args.cwd - Working directory path
+   * @param args.cacheTtlMs - Reuse output of an identical call for this many milliseconds (defaults to 0)
    * @returns Promise resolving to ToolResult with current branch name
    * @example
    * ```typescript
@@ -60,10 +62,10 @@ export class StatusOperations {
    * }
    * ```
    */
-  static async getCurrentBranch(args: { cwd?: string }): Promise<ToolResult> {
+  static async getCurrentBranch(args: { cwd?: string; cacheTtlMs?: number }): Promise<ToolResult> {
     try {
-      const { cwd = process.cwd() } = args;
-      const branch = execSync("git branch --show-current", { cwd, encoding: "utf-8" }).trim();
+      const { cwd = process.cwd(), cacheTtlMs = 0 } = args;
+      const branch = runGitCached(["branch", "--show-current"], cwd, cacheTtlMs).trim();
 
       return {
         success: true,
@@ -85,6 +87,7 @@ export class StatusOperations {
    * @param args - Configuration options
    * @param args.cwd - Working directory path
    * @param args.short - Use short hash format
+   * @param args.cacheTtlMs - Reuse output of an identical call for this many milliseconds (defaults to 0)
    * @returns Promise resolving to ToolResult with commit hash
    * @example
    * ```typescript
@@ -94,11 +97,11 @@ export class StatusOperations {
    * }
    * ```
    */
-  static async getLatestCommit(args: { cwd?: string; short?: boolean }): Promise<ToolResult> {
+  static async getLatestCommit(args: { cwd?: string; short?: boolean; cacheTtlMs?: number }): Promise<ToolResult> {
     try {
-      const { cwd = process.cwd(), short = false } = args;
-      const format = short ? "--short" : "";
-      const hash = execSync(`git rev-parse ${format} HEAD`, { cwd, encoding: "utf-8" }).trim();
+      const { cwd = process.cwd(), short = false, cacheTtlMs = 0 } = args;
+      const revArgs = short ? ["rev-parse", "--short", "HEAD"] : ["rev-parse", "HEAD"];
+      const hash = runGitCached(revArgs, cwd, cacheTtlMs).trim();
 
       return {
         success: true,
@@ -115,4 +118,41 @@ export class StatusOperations {
       };
     }
   }
+
+  /**
+   * Get branch, HEAD commit, upstream tracking and working tree state in one call
+   *
+   * Collects what gitStatus, getCurrentBranch and getLatestCommit return
+   * separately from a single `git status --porcelain=v2 --branch -z` invocation.
+   *
+   * @param args - Configuration options
+   * @param args.cwd - Working directory path
+   * @param args.cacheTtlMs - Reuse output of an identical call for this many milliseconds (defaults to 0)
+   * @returns Promise resolving to ToolResult with the repository snapshot
+   * @example
+   * ```typescript
+   * const result = await StatusOperations.getRepositorySnapshot({});
+   * if (result.success) {
+   *   console.log(result.data.branch, result.data.commit, result.data.isClean);
+   * }
+   * ```
+   */
+  static async getRepositorySnapshot(args: { cwd?: string; cacheTtlMs?: number }): Promise<ToolResult> {
+    try {
+      const { cwd = process.cwd(), cacheTtlMs = 0 } = args;
+      const output = runGitCached(["status", "--porcelain=v2", "--branch", "-z"], cwd, cacheTtlMs);
+      const snapshot = parsePorcelainV2(output);
+
+      return {
+        success: true,
+        data: snapshot,
+        logs: [`Branch: ${snapshot.branch ?? "(detached)"}, ${snapshot.entries.length} changed file(s)`],
+      };
+    } catch (error) {
+      return {
+        success: false,
+        error: error instanceof Error ? error.message : "Failed to get repository snapshot",
+      };
+    }
+  }
 }
@@ -65,7 +65,9 @@ export function registerDevelopmentTools(): void {
         description: "Get git repository status",
         enabled: true,
       },
-      handler: createHandler((args: { cwd?: string; short?: boolean }) => GitTools.gitStatus(args)),
+      handler: createHandler((args: { cwd?: string; short?: boolean; cacheTtlMs?: number }) =>
+        GitTools.gitStatus(args)
+      ),
     },
     {
       config: {
@@ -73,7 +75,7 @@ export function registerDevelopmentTools(): void {
         description: "Get current git branch name",
         enabled: true,
       },
-      handler: createHandler((args: { cwd?: string }) => GitTools.getCurrentBranch(args)),
+      handler: createHandler((args: { cwd?: string; cacheTtlMs?: number }) => GitTools.getCurrentBranch(args)),
     },
     {
       config: {
@@ -81,7 +83,9 @@ export function registerDevelopmentTools(): void {
         description: "Check if a git remote exists",
         enabled: true,
       },
-      handler: createHandler((args: { remoteName: string; cwd?: string }) => GitTools.checkRemoteExists(args)),
+      handler: createHandler((args: { remoteName: string; cwd?: string; cacheTtlMs?: number }) =>
+        GitTools.checkRemoteExists(args)
+      ),
     },
     {
       config: {
@@ -89,7 +93,9 @@ export function registerDevelopmentTools(): void {
         description: "Get URL for a git remote",
         enabled: true,
       },
-      handler: createHandler((args: { remoteName: string; cwd?: string }) => GitTools.getRemoteUrl(args)),
+      handler: createHandler((args: { remoteName: string; cwd?: string; cacheTtlMs?: number }) =>
+        GitTools.getRemoteUrl(args)
+      ),
     },
     {
       config: {
@@ -118,7 +124,7 @@ export function registerDevelopmentTools(): void {
         description: "List all git remotes",
         enabled: true,
       },
-      handler: createHandler((args: { cwd?: string }) => GitTools.listRemotes(args)),
+      handler: createHandler((args: { cwd?: string; cacheTtlMs?: number }) => GitTools.listRemotes(args)),
     },
     {
       config: {
@@ -134,7 +140,17 @@ export function registerDevelopmentTools(): void {
         description: "Get latest commit hash",
         enabled: true,
       },
-      handler: createHandler((args: { cwd?: string; short?: boolean }) => GitTools.getLatestCommit(args)),
+      handler: createHandler((args: { cwd?: string; short?: boolean; cacheTtlMs?: number }) =>
+        GitTools.getLatestCommit(args)
+      ),
+    },
+    {
+      config: {
+        name: "git_get_repository_snapshot",
+        description: "Get branch, latest commit, upstream tracking and changed files in a single git call",
+        enabled: true,
+      },
+      handler: createHandler((args: { cwd?: string; cacheTtlMs?: number }) => GitTools.getRepositorySnapshot(args)),
     },
     {
       config: {
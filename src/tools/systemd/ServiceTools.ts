@@ -27,6 +27,39 @@ async function getServiceManager() {
   return { SystemdServiceManager, SystemdClient, RollingUpdateManager, MetricsCollector, SecretsManager };
 }
 
+/**
+ * Create a getter for a shared instance built on first use
+ *
+ * The in-flight promise is cached so concurrent first calls share one
+ * instance; a failed creation is forgotten so the next call can retry.
+ *
+ * @param create - Factory that builds the instance
+ * @returns Getter resolving to the shared instance
+ */
+function lazyInstance<T>(create: () => Promise<T>): () => Promise<T> {
+  let pending: Promise<T> | null = null;
+  return () => {
+    pending ??= create().catch(error => {
+      pending = null;
+      throw error;
+    });
+    return pending;
+  };
+}
+
+// Shared instances, reused across tool calls
+const getManager = lazyInstance(async () => new (await getServiceManager()).SystemdServiceManager());
+const getClient = lazyInstance(async () => new (await getServiceManager()).SystemdClient());
+const getSecretsManager = lazyInstance(async () => new (await getServiceManager()).SecretsManager());
+const getRollingUpdateManager = lazyInstance(async () => {
+  const { RollingUpdateManager } = await getServiceManager();
+  return new RollingUpdateManager(await getManager());
+});
+const getMetricsCollector = lazyInstance(async () => {
+  const { MetricsCollector } = await getServiceManager();
+  return new MetricsCollector(await getClient());
+});
+
 /**
  * Systemd service management tools
  */
@@ -37,10 +70,7 @@ export class ServiceTools {
   static async startService(args: { name: string }): Promise<ToolResult> {
     try {
       const { name } = args;
-      const { SystemdServiceManager } = await getServiceManager();
-
-      // Create manager instance (singleton pattern would be better in production)
-      const manager = new SystemdServiceManager();
+      const manager = await getManager();
       await manager.startService(name);
 
       return {
@@ -62,9 +92,7 @@ export class ServiceTools {
   static async stopService(args: { name: string }): Promise<ToolResult> {
     try {
       const { name } = args;
-      const { SystemdServiceManager } = await getServiceManager();
-
-      const manager = new SystemdServiceManager();
+      const manager = await getManager();
       await manager.stopService(name);
 
       return {
@@ -86,9 +114,7 @@ export class ServiceTools {
   static async restartService(args: { name: string }): Promise<ToolResult> {
     try {
       const { name } = args;
-      const { SystemdServiceManager } = await getServiceManager();
-
-      const manager = new SystemdServiceManager();
+      const manager = await getManager();
       await manager.restartService(name);
 
       return {
@@ -110,9 +136,7 @@ export class ServiceTools {
   static async getServiceStatus(args: { name: string }): Promise<ToolResult> {
     try {
       const { name } = args;
-      const { SystemdServiceManager } = await getServiceManager();
-
-      const manager = new SystemdServiceManager();
+      const manager = await getManager();
       const info = await manager.getServiceInfo(name);
 
       if (!info) {
@@ -141,10 +165,7 @@ export class ServiceTools {
   static async getServiceMetrics(args: { name: string }): Promise<ToolResult> {
     try {
       const { name } = args;
-      const { SystemdClient, MetricsCollector } = await getServiceManager();
-
-      const client = new SystemdClient();
-      const collector = new MetricsCollector(client);
+      const collector = await getMetricsCollector();
       const metrics = await collector.collectServiceMetrics(name);
 
       return {
@@ -165,9 +186,7 @@ export class ServiceTools {
    */
   static async listServices(_args: {}): Promise<ToolResult> {
     try {
-      const { SystemdServiceManager } = await getServiceManager();
-
-      const manager = new SystemdServiceManager();
+      const manager = await getManager();
       const allInfo = await manager.getAllServiceInfo();
 
       const services = Object.keys(allInfo).map(name => ({
@@ -195,10 +214,7 @@ export class ServiceTools {
   static async updateService(args: { name: string; definition: any }): Promise<ToolResult> {
     try {
       const { name, definition } = args;
-      const { SystemdServiceManager, RollingUpdateManager } = await getServiceManager();
-
-      const manager = new SystemdServiceManager();
-      const updateManager = new RollingUpdateManager(manager);
+      const updateManager = await getRollingUpdateManager();
 
       const result = await updateManager.performRollingUpdate({
         serviceName: name,
@@ -232,10 +248,7 @@ export class ServiceTools {
   static async rollbackService(args: { name: string; oldVersion: string; newVersion: string }): Promise<ToolResult> {
     try {
       const { name, oldVersion, newVersion } = args;
-      const { SystemdServiceManager, RollingUpdateManager } = await getServiceManager();
-
-      const manager = new SystemdServiceManager();
-      const updateManager = new RollingUpdateManager(manager);
+      const updateManager = await getRollingUpdateManager();
 
       await updateManager.rollback(name, oldVersion, newVersion);
 
@@ -258,9 +271,7 @@ export class ServiceTools {
   static async getServiceLogs(args: { name: string; lines?: number }): Promise<ToolResult> {
     try {
       const { name, lines = 100 } = args;
-      const { SystemdClient } = await getServiceManager();
-
-      const client = new SystemdClient();
+      const client = await getClient();
       const logs = await client.getLogs(name, lines);
 
       return {
@@ -281,10 +292,7 @@ export class ServiceTools {
    */
   static async exportMetrics(_args: {}): Promise<ToolResult> {
     try {
-      const { SystemdClient, MetricsCollector } = await getServiceManager();
-
-      const client = new SystemdClient();
-      const collector = new MetricsCollector(client);
+      const collector = await getMetricsCollector();
       const prometheusMetrics = await collector.exportPrometheusMetrics();
 
       return {
@@ -311,9 +319,7 @@ export class ServiceTools {
   }): Promise<ToolResult> {
     try {
       const { serviceName, secretName, value, encrypt = true } = args;
-      const { SecretsManager } = await getServiceManager();
-
-      const secretsManager = new SecretsManager();
+      const secretsManager = await getSecretsManager();
       const secretPath = await secretsManager.setSecret(serviceName, secretName, value, encrypt);
 
       return {
@@ -335,9 +341,7 @@ export class ServiceTools {
   static async getSecret(args: { serviceName: string; secretName: string }): Promise<ToolResult> {
     try {
       const { serviceName, secretName } = args;
-      const { SecretsManager } = await getServiceManager();
-
-      const secretsManager = new SecretsManager();
+      const secretsManager = await getSecretsManager();
       const value = await secretsManager.getSecret(serviceName, secretName);
 
       if (!value) {
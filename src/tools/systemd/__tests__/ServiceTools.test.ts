@@ -0,0 +1,71 @@
+/**
+ * @file Systemd Service Tools Tests
+ *
+ * Tests for sharing lazily created systemd instances across tool calls
+ */
+
+import { describe, it, expect, vi, beforeEach } from "vitest";
+
+const state = vi.hoisted(() => ({ created: [] as object[], failuresRemaining: 0 }));
+
+vi.mock("@entropy-tamer/reynard-service-manager/systemd", () => {
+  class SystemdServiceManager {
+    constructor() {
+      if (state.failuresRemaining > 0) {
+        state.failuresRemaining--;
+        throw new Error("systemd unavailable");
+      }
+      state.created.push(this);
+    }
+
+    async startService(): Promise<void> {}
+  }
+
+  return {
+    SystemdServiceManager,
+    SystemdClient: class {},
+    RollingUpdateManager: class {},
+    MetricsCollector: class {},
+    SecretsManager: class {},
+  };
+});
+
+/**
+ * Import a fresh copy of ServiceTools so every test starts without shared instances
+ */
+async function loadServiceTools() {
+  vi.resetModules();
+  return (await import("../ServiceTools")).ServiceTools;
+}
+
+describe("ServiceTools shared instances", () => {
+  beforeEach(() => {
+    state.created.length = 0;
+    state.failuresRemaining = 0;
+  });
+
+  it("should create one manager for concurrent first calls", async () => {
+    const ServiceTools = await loadServiceTools();
+
+    const results = await Promise.all([
+      ServiceTools.startService({ name: "a" }),
+      ServiceTools.startService({ name: "b" }),
+    ]);
+
+    expect(results.every(result => result.success)).toBe(true);
+    expect(state.created).toHaveLength(1);
+  });
+
+  it("should retry creation after a failed first call", async () => {
+    const ServiceTools = await loadServiceTools();
+    state.failuresRemaining = 1;
+
+    const failed = await ServiceTools.startService({ name: "a" });
+    const retried = await ServiceTools.startService({ name: "a" });
+
+    expect(failed.success).toBe(false);
+    expect(failed.error).toBe("systemd unavailable");
+    expect(retried.success).toBe(true);
+    expect(state.created).toHaveLength(1);
+  });
+});